@@ -0,0 +1,264 @@
+"""
+Sharding layer for the Student Management System
+Description: Routes studentdata rows to database nodes by student ID
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import heapq
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+CREATE_TABLE_QUERY = """
+    CREATE TABLE IF NOT EXISTS studentdata (
+        id INT PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        dob VARCHAR(15) NOT NULL,
+        gender VARCHAR(20) NOT NULL,
+        mobile VARCHAR(15) NOT NULL,
+        email VARCHAR(50) NOT NULL
+    )
+"""
+INSERT_QUERY = "INSERT INTO studentdata (id, name, dob, gender, mobile, email) VALUES (%s, %s, %s, %s, %s, %s)"
+
+# ============================================================================
+# ROUTING FUNCTIONS
+# ============================================================================
+SHARD_STRATEGIES = ("range", "hash")
+
+
+def shard_index(student_id, nodes, strategy):
+    """Return the index of the node that owns a student ID"""
+    student_id = int(student_id)
+
+    if strategy == "hash":
+        return student_id % len(nodes)
+    if strategy != "range":
+        raise ValueError(f"Unknown shard strategy {strategy!r}; use one of {SHARD_STRATEGIES}")
+
+    for index, node in enumerate(nodes):
+        low = node.get("min_id")
+        high = node.get("max_id")
+        if (low is None or student_id >= low) and (high is None or student_id <= high):
+            return index
+
+    raise ValueError(f"No shard configured for ID {student_id}")
+
+
+def get_shard(shards, student_id, strategy):
+    """Return the connected shard that owns a student ID"""
+    if not shards:
+        raise RuntimeError("Please connect to the database first.")
+    return shards[shard_index(student_id, [shard["node"] for shard in shards], strategy)]
+
+
+def group_by_shard(items, nodes, strategy, key=lambda item: item[0]):
+    """Split items into {node index: [items]} using key(item) as the ID"""
+    groups = {}
+    for item in items:
+        groups.setdefault(shard_index(key(item), nodes, strategy), []).append(item)
+    return groups
+
+# ============================================================================
+# QUERY FUNCTIONS
+# ============================================================================
+def shard_query(shard, query):
+    """Adapt query placeholders to the shard's database driver"""
+    if shard["node"]["engine"] == "sqlite":
+        return query.replace("%s", "?")
+    return query
+
+
+def run_on_shard(shard, query, params=()):
+    """Execute a query on one shard and return its cursor"""
+    cursor = shard["cursor"]
+    cursor.execute(shard_query(shard, query), params)
+    return cursor
+
+
+def map_shards(shards, func):
+    """Call func(index, shard) for every shard in parallel, in shard order"""
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        return list(pool.map(func, range(len(shards)), shards))
+
+
+def fetch_all_shards(shards, query, params=()):
+    """Run a query on every shard in parallel and merge the rows by ID
+
+    The query must return rows ordered by id so they can be merge-sorted.
+    """
+    if not shards:
+        raise RuntimeError("Please connect to the database first.")
+
+    def fetch(index, shard):
+        return run_on_shard(shard, query, params).fetchall()
+
+    results = map_shards(shards, fetch)
+
+    return list(heapq.merge(*results, key=lambda row: row[0]))
+
+
+def bulk_delete_students(shards, student_ids, strategy):
+    """Delete students by ID, one batch per shard, and return the rows removed
+
+    Every batch runs before any shard commits. If a batch fails, all shards
+    are rolled back; if a commit fails, the error names the shards that
+    were already committed.
+    """
+    if not shards:
+        raise RuntimeError("Please connect to the database first.")
+
+    nodes = [shard["node"] for shard in shards]
+    groups = group_by_shard(student_ids, nodes, strategy, key=int)
+    query = "DELETE FROM studentdata WHERE id=%s"
+
+    pending = []
+    deleted = 0
+    try:
+        for index, batch in groups.items():
+            shard = shards[index]
+            pending.append(shard)
+            shard["cursor"].executemany(shard_query(shard, query), [(int(sid),) for sid in batch])
+            deleted += shard["cursor"].rowcount
+    except Exception:
+        for shard in pending:
+            shard["con"].rollback()
+        raise
+
+    committed = []
+    for index in groups:
+        try:
+            shards[index]["con"].commit()
+        except Exception as e:
+            for other in groups:
+                if other not in committed:
+                    shards[other]["con"].rollback()
+            raise RuntimeError(f"Commit failed on shard {index} "
+                               f"(already committed: {committed or 'none'}): {e}") from e
+        committed.append(index)
+
+    return deleted
+
+# ============================================================================
+# CONNECTION FUNCTIONS
+# ============================================================================
+def connect_shard(node, host=None, user=None, password=None):
+    """Open a connection to one shard node and make sure its table exists"""
+    if node["engine"] == "sqlite":
+        # Fan-out queries run on worker threads
+        con = sqlite3.connect(node["path"], check_same_thread=False)
+        cursor = con.cursor()
+    else:
+        # Imported here so SQLite-only setups (and tests) don't need MySQL
+        import mysql.connector
+
+        con = mysql.connector.connect(
+            host=node.get("host", host),
+            user=node.get("user", user),
+            password=node.get("password", password),
+            port=node.get("port", 3306)
+        )
+        cursor = con.cursor()
+
+        # Create database if not exists
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {node['database']}")
+        cursor.execute(f"USE {node['database']}")
+
+    cursor.execute(CREATE_TABLE_QUERY)
+    con.commit()
+    return {"node": node, "con": con, "cursor": cursor}
+
+
+def validate_shard_config(nodes, strategy):
+    """Raise ValueError if the node list can't route every stored ID exactly once"""
+    if strategy not in SHARD_STRATEGIES:
+        raise ValueError(f"Unknown shard strategy {strategy!r}; use one of {SHARD_STRATEGIES}")
+
+    if not nodes:
+        raise ValueError("At least one shard node must be configured.")
+
+    if strategy == "range":
+        # None is an explicit open bound; a missing key is a config mistake
+        for index, node in enumerate(nodes):
+            if "min_id" not in node or "max_id" not in node:
+                raise ValueError(f"Shard {index} needs both min_id and max_id for range routing.")
+
+        # shard_index picks the first matching range, so rows stored on a
+        # later node inside an overlap could never be reached
+        def lower(node):
+            return float("-inf") if node.get("min_id") is None else node["min_id"]
+
+        def upper(node):
+            return float("inf") if node.get("max_id") is None else node["max_id"]
+
+        ordered = sorted(enumerate(nodes), key=lambda item: lower(item[1]))
+        for (prev_index, prev), (index, node) in zip(ordered, ordered[1:]):
+            if lower(node) <= upper(prev):
+                raise ValueError(f"The ID ranges of shard {prev_index} and shard {index} overlap.")
+
+
+def misplaced_count(shard, index, shard_count, strategy):
+    """Count rows on a shard that the routing would send to another shard"""
+    # Bounds are config integers, so they are inlined rather than bound
+    if strategy == "hash":
+        condition = f"id % {int(shard_count)} <> {int(index)}"
+    else:
+        bounds = []
+        if shard["node"].get("min_id") is not None:
+            bounds.append(f"id < {int(shard['node']['min_id'])}")
+        if shard["node"].get("max_id") is not None:
+            bounds.append(f"id > {int(shard['node']['max_id'])}")
+        if not bounds:
+            return 0
+        condition = " OR ".join(bounds)
+
+    return run_on_shard(shard, f"SELECT COUNT(*) FROM studentdata WHERE {condition}").fetchone()[0]
+
+
+def check_shard_layout(shards, strategy):
+    """Raise ValueError if any shard holds rows it would no longer be routed
+
+    With hash routing this catches a node being added or removed, which
+    would otherwise send lookups for existing IDs to the wrong shard.
+    The counts run on all shards at once, as the hash check scans each table.
+    """
+    def count_misplaced(index, shard):
+        return misplaced_count(shard, index, len(shards), strategy)
+
+    for index, count in enumerate(map_shards(shards, count_misplaced)):
+        if count:
+            raise ValueError(f"Shard {index} holds {count} student(s) that {strategy} routing "
+                             f"assigns to another shard. The node list no longer matches the "
+                             f"stored data; restore it or move the rows before connecting.")
+
+
+def close_shards(shards):
+    """Close every shard connection, ignoring ones that are already gone"""
+    for shard in shards:
+        try:
+            shard["con"].close()
+        except Exception:
+            pass
+
+
+def connect_shards(nodes, strategy, host=None, user=None, password=None):
+    """Connect to every node and check that its rows match the routing
+
+    The node list is validated before anything is opened. The connections
+    already opened are closed if a node or the layout check fails.
+    """
+    validate_shard_config(nodes, strategy)
+
+    shards = []
+    try:
+        for node in nodes:
+            shards.append(connect_shard(node, host, user, password))
+        check_shard_layout(shards, strategy)
+    except Exception:
+        close_shards(shards)
+        raise
+    return shards
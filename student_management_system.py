@@ -9,7 +9,10 @@ Description: A GUI-based student management system using Tkinter and MySQL
 from tkinter import *
 from tkinter import messagebox, ttk
 from tkinter.ttk import Treeview, Style
+from sharding import (INSERT_QUERY, get_shard, run_on_shard,
+                      fetch_all_shards, connect_shards, close_shards)
 import mysql.connector
+import sqlite3
 import time
 import random
 import re
@@ -21,6 +24,30 @@ WINDOW_WIDTH = 1174
 WINDOW_HEIGHT = 700
 DB_NAME = "student_management_system"
 ANIMATION_COLORS = ["red", "green", "blue", "orange", "purple"]
+FRAME_BUDGET_MS = 16  # Max time spent inserting Treeview rows per slice
+
+# Sharding: each node holds a horizontal slice of studentdata.
+# - "mysql" nodes reuse the host/user/password from the connection dialog
+#   unless they set their own "host", "user", "password" or "port".
+# - "sqlite" nodes store their slice in a local file ("path"), which makes
+#   it easy to try several nodes on one machine.
+# SHARD_STRATEGY must be "range" or "hash". With "range" every node needs
+# both "min_id" and "max_id" (inclusive, None = unbounded) and the ranges
+# may not overlap. With "hash" an ID goes to node id % nodes.
+# Changing the node list (or a range) re-routes existing IDs, and rows are
+# not moved automatically. Connecting fails with a layout error if any
+# shard holds rows that the current config routes elsewhere; with "hash"
+# this means the number of nodes cannot change once they hold data.
+SHARD_STRATEGY = "hash"
+SHARD_NODES = [
+    {"engine": "mysql", "database": DB_NAME},
+]
+# Example local setup with two SQLite nodes split by ID range:
+# SHARD_STRATEGY = "range"
+# SHARD_NODES = [
+#     {"engine": "sqlite", "path": "studentdata_0.db", "min_id": 1, "max_id": 9999},
+#     {"engine": "sqlite", "path": "studentdata_1.db", "min_id": 10000, "max_id": None},
+# ]
 
 # ============================================================================
 # VALIDATION FUNCTIONS
@@ -41,13 +68,56 @@ def validate_id(student_id):
     except ValueError:
         return False
 
+# ============================================================================
+# TREEVIEW FUNCTIONS
+# ============================================================================
+def populate_treeview(data):
+    """Fill the Treeview in time-sliced batches so the window stays responsive
+
+    The first slice is inserted right away; the rest run via after_idle.
+    Calling this again cancels any population still in progress.
+    """
+    global populate_job
+
+    # Cancel an older population before clearing the grid
+    if populate_job is not None:
+        root.after_cancel(populate_job)
+        populate_job = None
+
+    framedata.delete(*framedata.get_children())
+
+    rows = iter(data)
+    total = len(data)
+    inserted = 0
+
+    def insert_slice():
+        global populate_job
+        nonlocal inserted
+
+        deadline = time.perf_counter() + FRAME_BUDGET_MS / 1000
+        for item in rows:
+            framedata.insert('', END, values=item)
+            inserted += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        progressLabel.config(text=f"Loaded {inserted} / {total} records")
+
+        if inserted < total:
+            populate_job = root.after_idle(insert_slice)
+        else:
+            populate_job = None
+
+    insert_slice()
+
+
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
 def addstudent():
     """Open window to add a new student"""
     def submitadd():
-        global con, mycursor, framedata
+        global framedata
 
         # Get and strip input values
         id_val = idvalue.get().strip()
@@ -80,14 +150,14 @@ def addstudent():
             return
 
         # Check database connection
-        if mycursor is None:
+        if not shards:
             messagebox.showerror("DB Error", "Please connect to the database first.", parent=addstudt)
             return
 
         try:
-            query = "INSERT INTO studentdata (id, name, dob, gender, mobile, email) VALUES (%s, %s, %s, %s, %s, %s)"
-            mycursor.execute(query, (id_val, name, dob, gender, mobile, email))
-            con.commit()
+            shard = get_shard(shards, id_val, SHARD_STRATEGY)
+            run_on_shard(shard, INSERT_QUERY, (id_val, name, dob, gender, mobile, email))
+            shard["con"].commit()
             
             messagebox.showinfo("Success", f"Student '{name}' (ID: {id_val}) added successfully!", parent=addstudt)
 
@@ -102,7 +172,7 @@ def addstudent():
             # Refresh the Treeview
             showstudent()
 
-        except mysql.connector.errors.IntegrityError:
+        except (mysql.connector.errors.IntegrityError, sqlite3.IntegrityError):
             messagebox.showerror("Error", f"Student with ID {id_val} already exists!", parent=addstudt)
         except Exception as e:
             messagebox.showerror("Error", f"Database error:\n{str(e)}", parent=addstudt)
@@ -167,8 +237,6 @@ def addstudent():
 def searchstudent():
     """Search for a student by ID"""
     def search():
-        global con, mycursor
-
         student_id = idvalue.get().strip()
 
         if not student_id:
@@ -180,18 +248,16 @@ def searchstudent():
             return
 
         try:
+            # An ID lives on exactly one shard
             query = "SELECT * FROM studentdata WHERE id = %s"
-            mycursor.execute(query, (student_id,))
-            data = mycursor.fetchall()
+            data = run_on_shard(get_shard(shards, student_id, SHARD_STRATEGY), query, (student_id,)).fetchall()
 
             if not data:
                 messagebox.showinfo("No Result", f"No student found with ID {student_id}", parent=searchwin)
                 return
 
             # Clear Treeview and show search result
-            framedata.delete(*framedata.get_children())
-            for item in data:
-                framedata.insert('', END, values=item)
+            populate_treeview(data)
             
             searchwin.destroy()
 
@@ -225,8 +291,6 @@ def searchstudent():
 def deletestudent():
     """Delete a student record"""
     def delete():
-        global mycursor, con
-        
         student_id = idvalue.get().strip()
         
         if not student_id:
@@ -239,8 +303,8 @@ def deletestudent():
 
         try:
             # Check if record exists
-            mycursor.execute("SELECT name FROM studentdata WHERE id=%s", (student_id,))
-            result = mycursor.fetchone()
+            shard = get_shard(shards, student_id, SHARD_STRATEGY)
+            result = run_on_shard(shard, "SELECT name FROM studentdata WHERE id=%s", (student_id,)).fetchone()
             
             if result is None:
                 messagebox.showerror("Error", f"No student found with ID {student_id}", parent=deletestudentwin)
@@ -260,8 +324,8 @@ def deletestudent():
             
             # Delete the record
             query = "DELETE FROM studentdata WHERE id=%s"
-            mycursor.execute(query, (student_id,))
-            con.commit()
+            run_on_shard(shard, query, (student_id,))
+            shard["con"].commit()
             
             messagebox.showinfo("Success", f"Student '{student_name}' deleted successfully", parent=deletestudentwin)
             idvalue.set("")
@@ -310,8 +374,7 @@ def updatestudent():
             return
         
         try:
-            mycursor.execute("SELECT * FROM studentdata WHERE id = %s", (sid,))
-            result = mycursor.fetchone()
+            result = run_on_shard(get_shard(shards, sid, SHARD_STRATEGY), "SELECT * FROM studentdata WHERE id = %s", (sid,)).fetchone()
             
             if result:
                 namevalue.set(result[1])
@@ -328,8 +391,6 @@ def updatestudent():
 
     def update():
         """Update student record"""
-        global mycursor, con
-
         sid = idvalue.get().strip()
         name = namevalue.get().strip()
         gender = gendervalue.get()
@@ -356,8 +417,8 @@ def updatestudent():
 
         try:
             # Check if student exists
-            mycursor.execute("SELECT * FROM studentdata WHERE id = %s", (sid,))
-            if mycursor.fetchone() is None:
+            shard = get_shard(shards, sid, SHARD_STRATEGY)
+            if run_on_shard(shard, "SELECT * FROM studentdata WHERE id = %s", (sid,)).fetchone() is None:
                 messagebox.showerror("Error", f"No student found with ID {sid}", parent=updatewin)
                 return
 
@@ -367,8 +428,8 @@ def updatestudent():
                 SET name=%s, gender=%s, dob=%s, mobile=%s, email=%s 
                 WHERE id=%s
             """
-            mycursor.execute(query, (name, gender, dob, mobile, email, sid))
-            con.commit()
+            run_on_shard(shard, query, (name, gender, dob, mobile, email, sid))
+            shard["con"].commit()
 
             messagebox.showinfo("Success", f"Student ID {sid} updated successfully!", parent=updatewin)
 
@@ -442,20 +503,16 @@ def updatestudent():
 def showstudent():
     """Display all students in the Treeview"""
     try:
-        if mycursor is None:
+        if not shards:
             messagebox.showerror("Error", "Please connect to the database first")
             return
         
+        # Query every shard in parallel and merge the sorted results
         query = "SELECT * FROM studentdata ORDER BY id"
-        mycursor.execute(query)
-        data = mycursor.fetchall()
-        
-        # Clear existing data
-        framedata.delete(*framedata.get_children())
+        data = fetch_all_shards(shards, query)
         
-        # Insert all records
-        for item in data:
-            framedata.insert('', END, values=item)
+        # Replace existing data, inserting records in batches
+        populate_treeview(data)
             
     except Exception as e:
         messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
@@ -471,7 +528,7 @@ def exitstudent():
 def connectdb():
     """Connect to MySQL database"""
     def submitdb():
-        global con, mycursor
+        global shards
 
         host = hostval.get().strip()
         user = userval.get().strip()
@@ -482,31 +539,12 @@ def connectdb():
             return
 
         try:
-            # Establish connection
-            con = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password,
-                port=3306
-            )
-            mycursor = con.cursor()
-            
-            # Create database if not exists
-            mycursor.execute(f"CREATE DATABASE IF NOT EXISTS {DB_NAME}")
-            mycursor.execute(f"USE {DB_NAME}")
-            
-            # Create table with consistent column names (lowercase)
-            mycursor.execute("""
-                CREATE TABLE IF NOT EXISTS studentdata (
-                    id INT PRIMARY KEY,
-                    name VARCHAR(50) NOT NULL,
-                    dob VARCHAR(15) NOT NULL,
-                    gender VARCHAR(20) NOT NULL,
-                    mobile VARCHAR(15) NOT NULL,
-                    email VARCHAR(50) NOT NULL
-                )
-            """)
-            con.commit()
+            # Establish a connection to every shard node
+            new_shards = connect_shards(SHARD_NODES, SHARD_STRATEGY, host, user, password)
+
+            # Release the connections from any earlier connect
+            close_shards(shards)
+            shards = new_shards
             
             messagebox.showinfo("Success", "Database connected successfully!", parent=dbroot)
             
@@ -517,6 +555,10 @@ def connectdb():
             
         except mysql.connector.Error as e:
             messagebox.showerror("Connection Failed", f"MySQL Error:\n{str(e)}", parent=dbroot)
+        except sqlite3.Error as e:
+            messagebox.showerror("Connection Failed", f"SQLite Error:\n{str(e)}", parent=dbroot)
+        except ValueError as e:
+            messagebox.showerror("Shard Layout Error", str(e), parent=dbroot)
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error:\n{str(e)}", parent=dbroot)
 
@@ -593,8 +635,8 @@ def introlabeltick():
 # ============================================================================
 
 # Initialize global variables
-con = None
-mycursor = None
+shards = []  # One {"node", "con", "cursor"} entry per SHARD_NODES item
+populate_job = None  # after_idle id of the running Treeview population
 
 # Create main window
 root = Tk()
@@ -640,6 +682,10 @@ style = ttk.Style()
 style.configure("Treeview.Heading", font=('roman', 12, 'bold'), foreground='blue')
 style.configure("Treeview", font=('times', 12, 'bold'), foreground='black', background='cyan')
 
+# Progress of the Treeview population
+progressLabel = Label(ShowDataFrame, text="", font=("times", 11, "bold"), bg="gold2", anchor="w")
+progressLabel.pack(side=BOTTOM, fill=X)
+
 # Scrollbars
 scroll_x = Scrollbar(ShowDataFrame, orient=HORIZONTAL)
 scroll_y = Scrollbar(ShowDataFrame, orient=VERTICAL)
@@ -0,0 +1,215 @@
+"""
+Tests for the sharding layer, using SQLite files as stand-in nodes
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+import sharding
+from sharding import (INSERT_QUERY, shard_index, group_by_shard, validate_shard_config,
+                      connect_shard, connect_shards, close_shards, run_on_shard, get_shard,
+                      fetch_all_shards, bulk_delete_students)
+
+RANGE_NODES = [
+    {"engine": "sqlite", "min_id": 1, "max_id": 10},
+    {"engine": "sqlite", "min_id": 11, "max_id": None},
+]
+
+
+def make_row(student_id):
+    return (student_id, f"Student {student_id}", "01/01/2000", "Male", "9876543210", "s@example.com")
+
+
+@pytest.fixture
+def range_shards(tmp_path):
+    nodes = [dict(node, path=str(tmp_path / f"shard_{i}.db")) for i, node in enumerate(RANGE_NODES)]
+    shards = [connect_shard(node) for node in nodes]
+    yield shards
+    for shard in shards:
+        shard["con"].close()
+
+
+def insert_students(shards, student_ids):
+    for student_id in student_ids:
+        shard = get_shard(shards, student_id, "range")
+        run_on_shard(shard, INSERT_QUERY, make_row(student_id))
+        shard["con"].commit()
+
+
+def shard_ids(shard):
+    shard["cursor"].execute("SELECT id FROM studentdata ORDER BY id")
+    return [row[0] for row in shard["cursor"].fetchall()]
+
+
+def test_range_routing():
+    assert shard_index(1, RANGE_NODES, "range") == 0
+    assert shard_index("10", RANGE_NODES, "range") == 0
+    assert shard_index(11, RANGE_NODES, "range") == 1
+    assert shard_index(10**9, RANGE_NODES, "range") == 1
+
+
+def test_range_routing_rejects_unmapped_id():
+    with pytest.raises(ValueError, match="No shard configured for ID 0"):
+        shard_index(0, RANGE_NODES, "range")
+
+
+def test_routing_rejects_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown shard strategy 'Hash'"):
+        shard_index(1, RANGE_NODES, "Hash")
+
+
+def test_hash_routing():
+    nodes = [{"engine": "sqlite"}] * 3
+    assert [shard_index(i, nodes, "hash") for i in range(6)] == [0, 1, 2, 0, 1, 2]
+
+
+def test_group_by_shard():
+    groups = group_by_shard([3, 15, 7, 20], RANGE_NODES, "range", key=int)
+    assert groups == {0: [3, 7], 1: [15, 20]}
+
+
+def test_bulk_delete_splits_ids_per_shard(range_shards):
+    insert_students(range_shards, (2, 5, 14, 18))
+
+    # 30 is routed to shard 1 but doesn't exist, so it isn't counted
+    assert bulk_delete_students(range_shards, ["5", "14", "30"], "range") == 2
+
+    assert shard_ids(range_shards[0]) == [2]
+    assert shard_ids(range_shards[1]) == [18]
+
+
+def test_bulk_delete_rolls_back_every_shard_on_failure(range_shards):
+    insert_students(range_shards, (2, 5, 14))
+    range_shards[1]["cursor"].execute("ALTER TABLE studentdata RENAME TO studentdata_old")
+
+    with pytest.raises(Exception):
+        bulk_delete_students(range_shards, [2, 5, 14], "range")
+
+    # Nothing from the failed call may be left pending on shard 0
+    range_shards[0]["con"].commit()
+    assert shard_ids(range_shards[0]) == [2, 5]
+
+
+def test_fetch_all_shards_merges_by_id(range_shards):
+    insert_students(range_shards, (25, 3, 11, 8, 40, 1))
+
+    rows = fetch_all_shards(range_shards, "SELECT * FROM studentdata ORDER BY id")
+
+    assert [row[0] for row in rows] == [1, 3, 8, 11, 25, 40]
+    assert rows[0] == make_row(1)
+
+
+def test_fetch_all_shards_requires_connection():
+    with pytest.raises(RuntimeError):
+        fetch_all_shards([], "SELECT * FROM studentdata ORDER BY id")
+
+
+def test_connect_shards_closes_opened_connections_on_failure(tmp_path, monkeypatch):
+    opened = []
+    real_connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        con = real_connect(*args, **kwargs)
+        opened.append(con)
+        return con
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    nodes = [
+        {"engine": "sqlite", "path": str(tmp_path / "shard_0.db")},
+        {"engine": "sqlite", "path": str(tmp_path / "missing" / "shard_1.db")},
+    ]
+
+    with pytest.raises(sqlite3.OperationalError):
+        connect_shards(nodes, "hash")
+
+    assert len(opened) == 1
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
+
+
+def test_connect_shards_accepts_matching_layout(tmp_path):
+    nodes = [{"engine": "sqlite", "path": str(tmp_path / f"shard_{i}.db")} for i in range(2)]
+    shards = connect_shards(nodes, "hash")
+    for student_id in (1, 2, 3, 4):
+        shard = get_shard(shards, student_id, "hash")
+        run_on_shard(shard, INSERT_QUERY, make_row(student_id))
+        shard["con"].commit()
+    close_shards(shards)
+
+    close_shards(connect_shards(nodes, "hash"))
+
+
+def test_connect_shards_rejects_hash_node_count_change(tmp_path):
+    nodes = [{"engine": "sqlite", "path": str(tmp_path / f"shard_{i}.db")} for i in range(2)]
+    shards = connect_shards(nodes, "hash")
+    run_on_shard(shards[1], INSERT_QUERY, make_row(3))
+    shards[1]["con"].commit()
+    close_shards(shards)
+
+    nodes.append({"engine": "sqlite", "path": str(tmp_path / "shard_2.db")})
+    with pytest.raises(ValueError, match="Shard 1 holds 1 student"):
+        connect_shards(nodes, "hash")
+
+
+def test_connect_shards_rejects_rows_outside_range(tmp_path):
+    nodes = [dict(node, path=str(tmp_path / f"shard_{i}.db")) for i, node in enumerate(RANGE_NODES)]
+    shards = connect_shards(nodes, "range")
+    run_on_shard(shards[0], INSERT_QUERY, make_row(7))
+    shards[0]["con"].commit()
+    close_shards(shards)
+
+    nodes[0]["max_id"] = 5
+    nodes[1]["min_id"] = 6
+    with pytest.raises(ValueError, match="Shard 0 holds 1 student"):
+        connect_shards(nodes, "range")
+
+
+def test_validate_shard_config_rejects_overlapping_ranges():
+    nodes = [
+        {"engine": "sqlite", "min_id": 1, "max_id": 10},
+        {"engine": "sqlite", "min_id": 5, "max_id": None},
+    ]
+    with pytest.raises(ValueError, match="shard 0 and shard 1 overlap"):
+        validate_shard_config(nodes, "range")
+
+    nodes[1]["min_id"] = 11
+    validate_shard_config(nodes, "range")
+
+
+def test_connect_shards_rejects_overlapping_ranges_before_connecting(tmp_path):
+    nodes = [
+        {"engine": "sqlite", "path": str(tmp_path / "shard_0.db"), "min_id": 1, "max_id": 10},
+        {"engine": "sqlite", "path": str(tmp_path / "shard_1.db"), "min_id": 5, "max_id": None},
+    ]
+    with pytest.raises(ValueError, match="overlap"):
+        connect_shards(nodes, "range")
+
+    assert not (tmp_path / "shard_0.db").exists()
+
+
+def test_validate_shard_config_rejects_bad_strategy_and_missing_bounds():
+    with pytest.raises(ValueError, match="Unknown shard strategy"):
+        validate_shard_config([{"engine": "sqlite"}], "Hash")
+
+    with pytest.raises(ValueError, match="Shard 1 needs both min_id and max_id"):
+        validate_shard_config([{"engine": "sqlite", "min_id": 1, "max_id": 10},
+                               {"engine": "sqlite", "min_id": 11}], "range")
+
+    with pytest.raises(ValueError, match="At least one shard node"):
+        validate_shard_config([], "hash")
+
+
+def test_layout_check_counts_every_shard_in_parallel(tmp_path, monkeypatch):
+    nodes = [{"engine": "sqlite", "path": str(tmp_path / f"shard_{i}.db")} for i in range(3)]
+    barrier = threading.Barrier(len(nodes), timeout=5)
+    real_count = sharding.misplaced_count
+
+    def waiting_count(*args):
+        # Only returns if all shards are being counted at the same time
+        barrier.wait()
+        return real_count(*args)
+
+    monkeypatch.setattr(sharding, "misplaced_count", waiting_count)
+    close_shards(connect_shards(nodes, "hash"))